@@ -1,8 +1,8 @@
 from pathlib import Path
 import mido as mid
 
-from .music import Note, Piece
-from .utils import ticks2seconds
+from .music import Note, Piece, piece_paths
+from .utils import ticks2seconds, file_hash
 
 
 def print_messages(midi):
@@ -20,8 +20,26 @@ def check_pedal(midi):
     return False
 
 
-def midi2piece(name: str, file_path: Path, final_rest: float = 0.):
+def midi2piece(name: str, file_path: Path, final_rest: float = 0.,
+               cache_dir: Path = None):
+    # Reuse a previously parsed piece with the same file content
+    source_hash = None
+    if cache_dir is not None:
+        source_hash = file_hash(file_path)
+        cache_path = Path(cache_dir) / Path(source_hash + '.npy')
+        notes_path, meta_path = piece_paths(cache_path)
+        if notes_path.exists() and meta_path.exists():
+            try:
+                piece = Piece.load(cache_path)
+                piece.name = name
+                piece.final_rest = final_rest
+                return piece
+            except (OSError, EOFError, ValueError):
+                # Stale or damaged entry: parse again and overwrite it
+                pass
+
     piece = Piece(name, final_rest)
+    piece.file_hash = source_hash
     midi = mid.MidiFile(file_path)
 
     # Check unimplemented features
@@ -70,4 +88,12 @@ def midi2piece(name: str, file_path: Path, final_rest: float = 0.):
             tempo = msg.tempo
             bpm = mid.tempo2bpm(tempo)
 
+    if cache_dir is not None:
+        try:
+            Path(cache_dir).mkdir(parents=True, exist_ok=True)
+            piece.save(cache_path)
+        except OSError:
+            # The cache is only an optimisation: keep the parsed piece
+            pass
+
     return piece
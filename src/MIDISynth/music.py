@@ -1,6 +1,16 @@
+import os
+import tempfile
+from pathlib import Path
+import numpy as np
 import music21 as m21
 
 
+# Bump when the saved layout or the MIDI parsing in midi2piece changes
+PIECE_FORMAT_VERSION = 1
+NOTE_DTYPE = np.dtype([('note_number', 'i2'), ('velocity', 'i2'),
+                       ('start_seconds', 'f8'), ('end_seconds', 'f8')])
+
+
 class Pitch:
     def __init__(self, note_number: int):
         self.note_number = note_number
@@ -36,7 +46,25 @@ class Piece:
     def __init__(self, name: str = None, final_rest: float = 0.):
         self.name: str = name
         self.final_rest: float = final_rest
-        self.notes: list[Note] = list()
+        self.file_hash: str = None
+        self._notes: list[Note] = list()
+        self._note_array: np.ndarray = None
+
+    @property
+    def notes(self) -> list[Note]:
+        # Notes loaded from a cache are only built when first accessed
+        if self._note_array is not None:
+            self._notes = [Note(int(n['note_number']), int(n['velocity']),
+                                float(n['start_seconds']),
+                                float(n['end_seconds']))
+                           for n in self._note_array]
+            self._note_array = None
+        return self._notes
+
+    @notes.setter
+    def notes(self, notes: list[Note]):
+        self._notes = notes
+        self._note_array = None
 
     def __str__(self) -> str:
         result = ""
@@ -54,8 +82,87 @@ class Piece:
         return result
 
     def duration(self):
+        if self._note_array is not None:
+            dur = float(self._note_array['end_seconds'].max(initial=0.))
+            return dur + self.final_rest
+
         dur = 0.
         for note in self.notes:
             if note.end_seconds > dur:
                 dur = note.end_seconds
         return dur + self.final_rest
+
+    def note_array(self) -> np.ndarray:
+        if self._note_array is not None:
+            return self._note_array
+
+        notes = [note for note in self._notes if isinstance(note, Note)]
+        array = np.zeros(len(notes), dtype=NOTE_DTYPE)
+        for i, note in enumerate(notes):
+            array[i] = (note.note_number, note.velocity, note.start_seconds,
+                        note.end_seconds)
+        return array
+
+    def save(self, file_path: Path):
+        # Notes go to an .npy file that can be memory-mapped on load, the
+        # rest of the attributes to a small companion .meta.npy file
+        notes_path, meta_path = piece_paths(file_path)
+        name = self.name or ''
+        file_hash = self.file_hash or ''
+        metadata = np.array((PIECE_FORMAT_VERSION, name, self.final_rest,
+                             file_hash),
+                            dtype=[('version', 'i4'),
+                                   ('name', 'U%d' % max(len(name), 1)),
+                                   ('final_rest', 'f8'),
+                                   ('file_hash', 'U%d' % max(len(file_hash),
+                                                             1))])
+
+        # The notes file is replaced last: once it exists, so does the meta
+        save_atomic(meta_path, metadata)
+        save_atomic(notes_path, self.note_array())
+
+    @classmethod
+    def load(cls, file_path: Path) -> 'Piece':
+        notes_path, meta_path = piece_paths(file_path)
+        metadata = np.load(meta_path)
+        if metadata.dtype.names is None \
+                or 'version' not in metadata.dtype.names \
+                or int(metadata['version']) != PIECE_FORMAT_VERSION:
+            raise ValueError("Piece file " + str(meta_path) + " does not "
+                             "have format version "
+                             + str(PIECE_FORMAT_VERSION) + ".")
+
+        piece = cls(str(metadata['name']) or None,
+                    float(metadata['final_rest']))
+        piece.file_hash = str(metadata['file_hash']) or None
+        piece._note_array = np.load(notes_path, mmap_mode='r')
+        if piece._note_array.dtype != NOTE_DTYPE:
+            raise ValueError("Piece file " + str(notes_path) + " does not "
+                             "contain a note array.")
+        return piece
+
+
+def piece_paths(file_path: Path):
+    # Suffixes are appended, so 'op.27.no1' and 'op.27.no2' do not collide
+    file_path = Path(file_path)
+    if file_path.suffix == '.npy':
+        stem = file_path.name[:-len('.npy')]
+    else:
+        stem = file_path.name
+    return file_path.with_name(stem + '.npy'), \
+        file_path.with_name(stem + '.meta.npy')
+
+
+def save_atomic(file_path: Path, array: np.ndarray):
+    # Write to a temporary file next to the target and move it into place
+    fd, tmp_path = tempfile.mkstemp(dir=file_path.parent,
+                                    prefix=file_path.name + '.',
+                                    suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as file:
+            np.save(file, array)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
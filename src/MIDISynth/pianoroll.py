@@ -1,6 +1,8 @@
+import math
+
 import numpy as np
 
-from MIDISynth.music import Piece, Note
+from MIDISynth.music import Piece
 from MIDISynth.utils import midi_to_hertz
 
 
@@ -9,24 +11,52 @@ def create_piano_roll(piece: Piece, frequency_vector, time_vector,
     # Initialize piano roll matrix
     piano_roll = np.zeros((len(frequency_vector), len(time_vector)))
 
-    for note in piece.notes:
-        if isinstance(note, Note):
-            freq = midi_to_hertz(note.note_number)
-            time_start = note.start_seconds
-            time_end = note.end_seconds
+    for note in piece.note_array():
+        freq = midi_to_hertz(int(note['note_number']))
+        time_start = float(note['start_seconds'])
+        time_end = float(note['end_seconds'])
 
-            tmp = freq * 2 ** (- semitone_width / 2 / bins_per_octave)
-            f_0 = tmp <= frequency_vector
-            f_1 = frequency_vector < freq * 2 ** (semitone_width / 2 /
-                                                  bins_per_octave)
-            f = np.logical_and(f_0, f_1)
+        tmp = freq * 2 ** (- semitone_width / 2 / bins_per_octave)
+        f_0 = tmp <= frequency_vector
+        f_1 = frequency_vector < freq * 2 ** (semitone_width / 2 /
+                                              bins_per_octave)
+        f = np.logical_and(f_0, f_1)
 
-            t_0 = time_start <= time_vector
-            t_1 = time_vector < time_end
-            t = np.logical_and(t_0, t_1)
+        t_0 = time_start <= time_vector
+        t_1 = time_vector < time_end
+        t = np.logical_and(t_0, t_1)
 
-            tf = np.expand_dims(f, 1) * np.expand_dims(t, 0)
+        tf = np.expand_dims(f, 1) * np.expand_dims(t, 0)
 
-            piano_roll[tf] = max(note.velocity, np.max(piano_roll[tf]))
+        piano_roll[tf] = max(int(note['velocity']), np.max(piano_roll[tf]))
 
     return piano_roll
+
+
+def downsample_piano_roll(piano_roll, factor=2):
+    # Max-pool the time axis so short notes survive the downsampling
+    n_freq, n_time = piano_roll.shape
+    remainder = n_time % factor
+    if remainder:
+        padding = np.repeat(piano_roll[:, -1:], factor - remainder, axis=1)
+        piano_roll = np.concatenate((piano_roll, padding), axis=1)
+
+    return piano_roll.reshape(n_freq, -1, factor).max(axis=2)
+
+
+def piano_roll_pyramid(piano_roll, min_columns=1):
+    # Level k has one column per 2 ** k columns of the original piano roll
+    pyramid = [piano_roll]
+    while pyramid[-1].shape[1] > min_columns:
+        pyramid.append(downsample_piano_roll(pyramid[-1]))
+
+    return pyramid
+
+
+def select_pyramid_level(pyramid, n_columns, width):
+    # Finest level whose visible columns fit in the available pixels
+    for level in range(len(pyramid)):
+        if math.ceil(n_columns / 2 ** level) <= width:
+            return level
+
+    return len(pyramid) - 1
@@ -4,6 +4,7 @@ import math
 import matplotlib.pyplot as plt
 import matplotlib.ticker as tick
 
+from .pianoroll import piano_roll_pyramid, select_pyramid_level
 from .utils import frequency_to_notes
 
 
@@ -50,13 +51,46 @@ def format_time(x, pos, t, plot_units=False):
         return ""
 
 
+def cached_formatter(formatter):
+    # Tick labels only depend on the rounded index, so compute each one once
+    cache = dict()
+
+    def wrapper(x, pos):
+        n = int(round(x))
+        if n not in cache:
+            cache[n] = formatter(n, pos)
+        return cache[n]
+
+    return wrapper
+
+
+def update_image(ax, image, pyramid):
+    n_freq, n_time = pyramid[0].shape
+    x_0, x_1 = ax.get_xlim()
+    c_0 = max(int(math.floor(x_0 + 0.5)), 0)
+    c_1 = min(int(math.ceil(x_1 + 0.5)), n_time)
+    if c_1 <= c_0:
+        return
+
+    width = max(int(ax.get_window_extent().width), 1)
+    level = select_pyramid_level(pyramid, c_1 - c_0, width)
+    factor = 2 ** level
+
+    # Only the visible columns of the selected level are handed to imshow
+    l_0 = c_0 // factor
+    l_1 = -(-c_1 // factor)
+    image.set_data(pyramid[level][:, l_0:l_1])
+    image.set_extent((l_0 * factor - 0.5, min(l_1 * factor, n_time) - 0.5,
+                      -0.5, n_freq - 0.5))
+
+
 def plot_time_frequency(a, t, f, v_min=0, v_max=1, c_map='Greys',
                         fig_title=None, show=True, block=True, numpy=True,
                         full_screen=False, fig_size=(640, 480),
                         freq_type='int',
                         freq_label='Frequency (Hz)', time_label='Time (s)',
                         plot_units=False, freq_names=None, dpi=120,
-                        backend='Qt5Agg'):
+                        backend='Qt5Agg', decimate=False):
     fig = plt.figure(figsize=(fig_size[0]/dpi, fig_size[1]/dpi), dpi=dpi)
 
     if fig_title:
@@ -69,19 +103,35 @@ def plot_time_frequency(a, t, f, v_min=0, v_max=1, c_map='Greys',
     else:
         a_plot = a.cpu().numpy()
 
-    ax.imshow(a_plot, cmap=c_map, aspect='auto', vmin=v_min, vmax=v_max,
-              origin='lower')
+    if decimate:
+        # Start from the coarsest level so imshow never copies the full matrix
+        pyramid = piano_roll_pyramid(a_plot)
+        n_freq, n_time = a_plot.shape
+        image = ax.imshow(pyramid[-1], cmap=c_map, aspect='auto',
+                          vmin=v_min, vmax=v_max, origin='lower',
+                          extent=(-0.5, n_time - 0.5, -0.5, n_freq - 0.5))
+        ax.set_xlim(-0.5, n_time - 0.5)
+        ax.set_ylim(-0.5, n_freq - 0.5)
+        ax.set_autoscale_on(False)
+        update_image(ax, image, pyramid)
+        ax.callbacks.connect('xlim_changed',
+                             lambda axes: update_image(axes, image, pyramid))
+        fig.canvas.mpl_connect('resize_event',
+                               lambda event: update_image(ax, image, pyramid))
+    else:
+        ax.imshow(a_plot, cmap=c_map, aspect='auto', vmin=v_min, vmax=v_max,
+                  origin='lower')
 
     # Freq axis
     ax.yaxis.set_major_formatter(
-        tick.FuncFormatter(lambda x, pos:
-                           format_freq(x, pos, f, freq_type, freq_names,
-                                       plot_units=plot_units)))
+        tick.FuncFormatter(cached_formatter(
+            lambda x, pos: format_freq(x, pos, f, freq_type, freq_names,
+                                       plot_units=plot_units))))
 
     # Time axis
     ax.xaxis.set_major_formatter(
-        tick.FuncFormatter(lambda x, pos: format_time(x, pos, t,
-                                                      plot_units=plot_units)))
+        tick.FuncFormatter(cached_formatter(
+            lambda x, pos: format_time(x, pos, t, plot_units=plot_units))))
 
     # Labels
     ax.set_xlabel(time_label)
@@ -105,7 +155,8 @@ def plot_time_frequency(a, t, f, v_min=0, v_max=1, c_map='Greys',
 
 
 def plot_piano_roll(piano_roll, frequency_vector, time_vector, name="",
-                    full_screen=False, show=True, block=False):
+                    full_screen=False, show=True, block=False,
+                    decimate=True):
     notes_vector = frequency_to_notes(frequency_vector)
 
     fig = plot_time_frequency(piano_roll, time_vector, frequency_vector,
@@ -114,6 +165,6 @@ def plot_piano_roll(piano_roll, frequency_vector, time_vector, name="",
                               freq_type='str', freq_label='Notes',
                               freq_names=notes_vector,
                               full_screen=full_screen,
-                              block=block, show=show)
+                              block=block, show=show, decimate=decimate)
 
     return fig
@@ -54,17 +54,19 @@ def synthesize(synthesizer: Synthesizer, piece: Piece, fs: int = 48000,
     signal = np.zeros(n_signal, dtype=np.float32)
 
     if verbose:
-        for note in tqdm.tqdm(piece.notes):
-            n_start: int = int(note.start_seconds * fs)
-            n_length: int = int(note.duration * fs)
+        for note in tqdm.tqdm(piece.note_array()):
+            n_start: int = int(note['start_seconds'] * fs)
+            n_length: int = int((note['end_seconds']
+                                 - note['start_seconds']) * fs)
             t = np.arange(n_length) / fs
 
-            f_0: float = midi_to_hertz(note.note_number)
+            f_0: float = midi_to_hertz(int(note['note_number']))
             f = f_0 * np.arange(1, synthesizer.number_harmonics + 1, 1)
 
             decay_harmonics: np.ndarray = synthesizer.decay_function(f)
 
-            starting_amplitude = velocity_to_amplitude(note.velocity)
+            starting_amplitude = velocity_to_amplitude(
+                int(note['velocity']))
 
             oscillators = np.sin(2 * np.pi * np.expand_dims(f, 1)
                                  * np.expand_dims(t, 0))
@@ -84,17 +86,19 @@ def synthesize(synthesizer: Synthesizer, piece: Piece, fs: int = 48000,
 
             signal[n_start: n_start + n_length] += signal_note
     else:
-        for note in piece.notes:
-            n_start: int = int(note.start_seconds * fs)
-            n_length: int = int(note.duration * fs)
+        for note in piece.note_array():
+            n_start: int = int(note['start_seconds'] * fs)
+            n_length: int = int((note['end_seconds']
+                                 - note['start_seconds']) * fs)
             t = np.arange(n_length) / fs
 
-            f_0: float = midi_to_hertz(note.note_number)
+            f_0: float = midi_to_hertz(int(note['note_number']))
             f = f_0 * np.arange(1, synthesizer.number_harmonics + 1, 1)
 
             decay_harmonics: np.ndarray = synthesizer.decay_function(f)
 
-            starting_amplitude = velocity_to_amplitude(note.velocity)
+            starting_amplitude = velocity_to_amplitude(
+                int(note['velocity']))
 
             oscillators = np.sin(2 * np.pi * np.expand_dims(f, 1)
                                  * np.expand_dims(t, 0))
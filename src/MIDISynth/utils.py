@@ -1,3 +1,4 @@
+import hashlib
 import numpy as np
 import music21 as m21
 
@@ -37,3 +38,11 @@ def ticks2seconds(ticks, ticks_per_beat, bpm):
 
 def velocity_to_amplitude(velocity: int, velocity_range: int = 128) -> float:
     return velocity / velocity_range
+
+
+def file_hash(file_path, chunk_size: int = 1 << 20) -> str:
+    sha = hashlib.sha256()
+    with open(file_path, 'rb') as file:
+        for chunk in iter(lambda: file.read(chunk_size), b''):
+            sha.update(chunk)
+    return sha.hexdigest()
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 10:40:02 2026
+
+@author: Gonzalo Romero-García
+"""
+
+from MIDISynth.music import Piece, Note, PIECE_FORMAT_VERSION
+from MIDISynth.midi import midi2piece
+
+import numpy as np
+import tempfile
+from pathlib import Path
+
+cache_tmp = tempfile.TemporaryDirectory()
+cache_dir = Path(cache_tmp.name)
+
+# Round trip
+piece = Piece("Example " * 50, 1.)
+piece.notes.append(Note(69, 80, 0., 1.))
+piece.notes.append(Note(71, 100, 0.5, 1.4))
+piece.notes.append(Note(72, 120, 1., 2.))
+piece.save(cache_dir / Path('op.27.no1'))
+Piece("Other").save(cache_dir / Path('op.27.no2'))
+
+loaded = Piece.load(cache_dir / Path('op.27.no1'))
+assert loaded.name == piece.name
+assert loaded.final_rest == piece.final_rest
+assert loaded.duration() == piece.duration()
+assert np.array_equal(loaded.note_array(), piece.note_array())
+assert [str(note) for note in loaded.notes] == \
+       [str(note) for note in piece.notes]
+
+# Empty piece
+empty = Piece.load(cache_dir / Path('op.27.no2'))
+assert empty.name == "Other"
+assert len(empty.note_array()) == 0
+assert empty.duration() == 0.
+assert empty.notes == []
+
+# Cache hit on the second call
+file_name = 'tempest'
+file_path = Path('..') / Path('data') / Path('midi') / Path(file_name + '.mid')
+parsed = midi2piece(file_name, file_path, 1., cache_dir=cache_dir)
+assert (cache_dir / Path(parsed.file_hash + '.npy')).exists()
+assert (cache_dir / Path(parsed.file_hash + '.meta.npy')).exists()
+
+notes_path = cache_dir / Path(parsed.file_hash + '.npy')
+meta_path = cache_dir / Path(parsed.file_hash + '.meta.npy')
+mtimes = (notes_path.stat().st_mtime_ns, meta_path.stat().st_mtime_ns)
+
+cached = midi2piece(file_name, file_path, 1., cache_dir=cache_dir)
+assert isinstance(cached.note_array(), np.memmap)
+assert (notes_path.stat().st_mtime_ns, meta_path.stat().st_mtime_ns) == mtimes
+assert cached.file_hash == parsed.file_hash
+assert cached.duration() == parsed.duration()
+assert np.array_equal(cached.note_array(), parsed.note_array())
+
+# Stale entry from another format version is parsed again and overwritten
+metadata = np.load(meta_path)
+metadata['version'] = PIECE_FORMAT_VERSION + 1
+np.save(meta_path, metadata)
+
+stale = midi2piece(file_name, file_path, 1., cache_dir=cache_dir)
+assert not isinstance(stale.note_array(), np.memmap)
+assert np.array_equal(stale.note_array(), parsed.note_array())
+assert int(np.load(meta_path)['version']) == PIECE_FORMAT_VERSION
+
+# Foreign metadata file is a miss as well
+np.save(meta_path, np.arange(3))
+foreign = midi2piece(file_name, file_path, 1., cache_dir=cache_dir)
+assert not isinstance(foreign.note_array(), np.memmap)
+assert int(np.load(meta_path)['version']) == PIECE_FORMAT_VERSION
+assert isinstance(midi2piece(file_name, file_path, 1., cache_dir=cache_dir)
+                  .note_array(), np.memmap)
+
+cache_tmp.cleanup()
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 10:12:31 2026
+
+@author: Gonzalo Romero-García
+"""
+
+import matplotlib
+matplotlib.use('Agg')
+
+from MIDISynth.pianoroll import downsample_piano_roll, piano_roll_pyramid, \
+    select_pyramid_level
+from MIDISynth.plot import plot_piano_roll, format_time
+
+import numpy as np
+from matplotlib.backend_bases import ResizeEvent
+
+# Max-pooling with an odd number of columns pads with the last column
+piano_roll = np.array([[0., 1., 0., 0., 2.],
+                       [3., 0., 0., 4., 0.]])
+downsampled = downsample_piano_roll(piano_roll)
+assert downsampled.shape == (2, 3)
+assert np.array_equal(downsampled, np.array([[1., 0., 2.],
+                                             [3., 4., 0.]]))
+
+# Pyramid levels: 1000 -> 500 -> 250 -> 125 -> 63 -> 32 -> 16 -> 8 -> 4 -> 2
+# -> 1 columns
+piano_roll = np.zeros((88, 1000))
+piano_roll[40, 123] = 100.
+pyramid = piano_roll_pyramid(piano_roll)
+assert len(pyramid) == 11
+assert [level.shape[1] for level in pyramid][:4] == [1000, 500, 250, 125]
+assert pyramid[-1].shape == (88, 1)
+assert all(level.max() == 100. for level in pyramid)
+
+# Level selection
+assert select_pyramid_level(pyramid, 1000, 1000) == 0
+assert select_pyramid_level(pyramid, 1000, 999) == 1
+assert select_pyramid_level(pyramid, 1000, 500) == 1
+assert select_pyramid_level(pyramid, 1000, 100) == 4
+assert select_pyramid_level(pyramid, 100, 640) == 0
+assert select_pyramid_level(pyramid, 1000, 0) == len(pyramid) - 1
+
+# Plot of a piano roll much wider than the axes
+f_min = 27.5  # La 0
+bins_per_octave = 12
+n_bins = int(bins_per_octave * (7 + 1 / 3))  # number of bins of a piano
+frequency_vector = f_min * 2 ** (np.arange(n_bins) / bins_per_octave)
+time_vector = np.arange(0, 60, 0.001)
+piano_roll = np.zeros((n_bins, len(time_vector)))
+piano_roll[48, 20000] = 100.
+
+fig = plot_piano_roll(piano_roll, frequency_vector, time_vector, "Example",
+                      show=False)
+ax = fig.axes[0]
+image = ax.images[0]
+
+
+def check_image():
+    width = ax.get_window_extent().width
+    x_0, x_1 = ax.get_xlim()
+    extent = image.get_extent()
+    assert image.get_array().shape[1] <= width
+    assert extent[0] <= max(x_0, -0.5)
+    assert extent[1] >= min(x_1, len(time_vector) - 0.5)
+    assert extent[1] <= len(time_vector) - 0.5
+
+
+check_image()
+assert image.get_array().max() == 100.
+
+# Zoom on a narrow window
+ax.set_xlim(19000, 23000)
+check_image()
+assert image.get_array().max() == 100.
+
+# Pan away from the note
+ax.set_xlim(40000, 44000)
+check_image()
+assert image.get_array().max() == 0.
+
+# Shrink the figure
+fig.set_size_inches(2, 2)
+fig.canvas.callbacks.process('resize_event',
+                             ResizeEvent('resize_event', fig.canvas))
+check_image()
+
+# Cached tick labels match the undecorated formatter
+formatter = ax.xaxis.get_major_formatter()
+for x in [0., 0.4, 1000., 20000.6, 59999., 60000., -3.]:
+    assert formatter(x, 0) == format_time(x, 0, time_vector)
+    assert formatter(x, 0) == format_time(x, 0, time_vector)